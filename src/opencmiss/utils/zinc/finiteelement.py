@@ -1,7 +1,6 @@
 """
 Utilities for creating and working with Zinc Finite Elements.
 """
-from opencmiss.utils.maths import vectorops
 from opencmiss.utils.zinc.general import ChangeManager
 from opencmiss.zinc.element import Element, Elementbasis, Elementfieldtemplate, Mesh
 from opencmiss.zinc.field import Field
@@ -9,52 +8,100 @@ from opencmiss.zinc.node import Node, Nodeset
 from opencmiss.zinc.result import RESULT_OK
 
 
-def create_triangle_elements(mesh: Mesh, finite_element_field: Field, element_node_set):
+_NODE_VALUE_LABELS = (
+    Node.VALUE_LABEL_VALUE, Node.VALUE_LABEL_D_DS1, Node.VALUE_LABEL_D_DS2, Node.VALUE_LABEL_D2_DS1DS2,
+    Node.VALUE_LABEL_D_DS3, Node.VALUE_LABEL_D2_DS1DS3, Node.VALUE_LABEL_D2_DS2DS3, Node.VALUE_LABEL_D3_DS1DS2DS3)
+
+# dimension of element shapes supported by create_linear_element_template
+_LINEAR_ELEMENT_SHAPE_DIMENSIONS = {
+    Element.SHAPE_TYPE_LINE: 1, Element.SHAPE_TYPE_SQUARE: 2, Element.SHAPE_TYPE_TRIANGLE: 2,
+    Element.SHAPE_TYPE_CUBE: 3, Element.SHAPE_TYPE_TETRAHEDRON: 3}
+
+
+def create_linear_element_template(mesh: Mesh, finite_element_field: Field, shape_type):
+    """
+    Create an element template defining the finite element field with a
+    linear basis on elements of the supplied shape. Build once and pass to the
+    element creation functions to reuse over repeated calls.
+
+    :param mesh: The Zinc Mesh to create elements in.
+    :param finite_element_field: Zinc FieldFiniteElement to interpolate from nodes.
+    :param shape_type: Element shape type with the same dimension as mesh, one of Element.SHAPE_TYPE_LINE,
+    SHAPE_TYPE_SQUARE or SHAPE_TYPE_CUBE for linear Lagrange, or SHAPE_TYPE_TRIANGLE or SHAPE_TYPE_TETRAHEDRON for
+    linear simplex basis.
+    :return: Zinc Elementtemplate, Elementfieldtemplate
+    """
+    dimension = mesh.getDimension()
+    assert _LINEAR_ELEMENT_SHAPE_DIMENSIONS.get(shape_type) == dimension, \
+        "opencmiss.utils.zinc.finiteelement.createLinearElementTemplate.  Unsupported shape for mesh dimension"
+    if shape_type in (Element.SHAPE_TYPE_TRIANGLE, Element.SHAPE_TYPE_TETRAHEDRON):
+        function_type = Elementbasis.FUNCTION_TYPE_LINEAR_SIMPLEX
+    else:
+        function_type = Elementbasis.FUNCTION_TYPE_LINEAR_LAGRANGE
+    fieldmodule = finite_element_field.getFieldmodule()
+    element_template = mesh.createElementtemplate()
+    element_template.setElementShapeType(shape_type)
+    linear_basis = fieldmodule.createElementbasis(dimension, function_type)
+    eft = mesh.createElementfieldtemplate(linear_basis)
+    element_template.defineField(finite_element_field, -1, eft)
+    return element_template, eft
+
+
+def create_triangle_elements(mesh: Mesh, finite_element_field: Field, element_node_set, define_faces=True,
+                             template=None):
     """
     Create a linear triangular element for every set of 3 local nodes in element_node_set.
 
     :param mesh: The Zinc Mesh to create elements in.
     :param finite_element_field: Zinc FieldFiniteElement to interpolate from nodes.
     :param element_node_set: Sequence of 3 node identifiers for each element.
+    :param define_faces: Set to False to skip defining faces, e.g. when creating several batches of elements and
+    calling fieldmodule.defineAllFaces() once at the end.
+    :param template: Optional (Elementtemplate, Elementfieldtemplate) from create_linear_element_template
+    for the same mesh, field and shape, to reuse over repeated calls. Asserts template shape matches.
     :return: None
     """
     assert mesh.getDimension() == 2
     assert finite_element_field.castFiniteElement().isValid()
     fieldmodule = finite_element_field.getFieldmodule()
-    element_template = mesh.createElementtemplate()
-    element_template.setElementShapeType(Element.SHAPE_TYPE_TRIANGLE)
-    linear_basis = fieldmodule.createElementbasis(2, Elementbasis.FUNCTION_TYPE_LINEAR_SIMPLEX)
-    eft = mesh.createElementfieldtemplate(linear_basis)
-    element_template.defineField(finite_element_field, -1, eft)
+    element_template, eft = template if template else \
+        create_linear_element_template(mesh, finite_element_field, Element.SHAPE_TYPE_TRIANGLE)
+    assert element_template.getElementShapeType() == Element.SHAPE_TYPE_TRIANGLE
+    # Bind method locally as it is called for every element
+    create_element = mesh.createElement
     with ChangeManager(fieldmodule):
         for element_nodes in element_node_set:
-            element = mesh.createElement(-1, element_template)
-            element.setNodesByIdentifier(eft, element_nodes)
-    fieldmodule.defineAllFaces()
+            create_element(-1, element_template).setNodesByIdentifier(eft, element_nodes)
+    if define_faces:
+        fieldmodule.defineAllFaces()
 
 
-def create_cube_element(mesh: Mesh, finite_element_field: Field, node_coordinate_set):
+def _create_single_linear_element(mesh: Mesh, finite_element_field: Field, node_coordinate_set, shape_type,
+                                  define_faces, template):
     """
-    Create a single finite element using the supplied
-    finite element field and sequence of 8 n-D node coordinates.
+    Create a single linear Lagrange finite element of the supplied shape
+    using the finite element field, creating a new node for each coordinate.
 
     :param mesh: The Zinc Mesh to create elements in.
     :param finite_element_field:  Zinc FieldFiniteElement to interpolate on element.
-    :param node_coordinate_set: Sequence of 8 coordinates each with as many components as finite element field.
+    :param node_coordinate_set: Sequence of coordinates each with as many components as finite element field,
+    one for each node of the linear Lagrange basis.
+    :param shape_type: Element.SHAPE_TYPE_SQUARE or Element.SHAPE_TYPE_CUBE matching mesh dimension.
+    :param define_faces: Set to False to skip defining faces.
+    :param template: Optional (Elementtemplate, Elementfieldtemplate) from create_linear_element_template,
+    asserted to have shape_type.
     :return: None
     """
-    assert mesh.getDimension() == 3
+    dimension = mesh.getDimension()
     assert finite_element_field.castFiniteElement().isValid()
-    assert len(node_coordinate_set) == 8
+    assert len(node_coordinate_set) == 2**dimension
     fieldmodule = finite_element_field.getFieldmodule()
     nodeset = fieldmodule.findNodesetByFieldDomainType(Field.DOMAIN_TYPE_NODES)
     node_template = nodeset.createNodetemplate()
     node_template.defineField(finite_element_field)
-    element_template = mesh.createElementtemplate()
-    element_template.setElementShapeType(Element.SHAPE_TYPE_CUBE)
-    linear_basis = fieldmodule.createElementbasis(3, Elementbasis.FUNCTION_TYPE_LINEAR_LAGRANGE)
-    eft = mesh.createElementfieldtemplate(linear_basis)
-    element_template.defineField(finite_element_field, -1, eft)
+    element_template, eft = template if template else \
+        create_linear_element_template(mesh, finite_element_field, shape_type)
+    assert element_template.getElementShapeType() == shape_type
     field_cache = fieldmodule.createFieldcache()
     with ChangeManager(fieldmodule):
         node_identifiers = []
@@ -65,10 +112,32 @@ def create_cube_element(mesh: Mesh, finite_element_field: Field, node_coordinate
             finite_element_field.assignReal(field_cache, node_coordinate)
         element = mesh.createElement(-1, element_template)
         element.setNodesByIdentifier(eft, node_identifiers)
-    fieldmodule.defineAllFaces()
+    if define_faces:
+        fieldmodule.defineAllFaces()
+
 
+def create_cube_element(mesh: Mesh, finite_element_field: Field, node_coordinate_set, define_faces=True,
+                        template=None):
+    """
+    Create a single finite element using the supplied
+    finite element field and sequence of 8 n-D node coordinates.
 
-def create_square_element(mesh: Mesh, finite_element_field: Field, node_coordinate_set):
+    :param mesh: The Zinc Mesh to create elements in.
+    :param finite_element_field:  Zinc FieldFiniteElement to interpolate on element.
+    :param node_coordinate_set: Sequence of 8 coordinates each with as many components as finite element field.
+    :param define_faces: Set to False to skip defining faces, e.g. when creating several elements and
+    calling fieldmodule.defineAllFaces() once at the end.
+    :param template: Optional (Elementtemplate, Elementfieldtemplate) from create_linear_element_template
+    for the same mesh, field and shape, to reuse over repeated calls. Asserts template shape matches.
+    :return: None
+    """
+    assert mesh.getDimension() == 3
+    _create_single_linear_element(mesh, finite_element_field, node_coordinate_set, Element.SHAPE_TYPE_CUBE,
+                                  define_faces, template)
+
+
+def create_square_element(mesh: Mesh, finite_element_field: Field, node_coordinate_set, define_faces=True,
+                          template=None):
     """
     Create a single square 2-D finite element using the supplied
     finite element field and sequence of 4 n-D node coordinates.
@@ -76,54 +145,81 @@ def create_square_element(mesh: Mesh, finite_element_field: Field, node_coordina
     :param mesh: The Zinc Mesh to create elements in.
     :param finite_element_field:  Zinc FieldFiniteElement to interpolate on element.
     :param node_coordinate_set: Sequence of 4 coordinates each with as many components as finite element field.
+    :param define_faces: Set to False to skip defining faces, e.g. when creating several elements and
+    calling fieldmodule.defineAllFaces() once at the end.
+    :param template: Optional (Elementtemplate, Elementfieldtemplate) from create_linear_element_template
+    for the same mesh, field and shape, to reuse over repeated calls. Asserts template shape matches.
     :return: None
     """
     assert mesh.getDimension() == 2
-    assert finite_element_field.castFiniteElement().isValid()
-    assert len(node_coordinate_set) == 4
-    fieldmodule = finite_element_field.getFieldmodule()
-    nodeset = fieldmodule.findNodesetByFieldDomainType(Field.DOMAIN_TYPE_NODES)
-    node_template = nodeset.createNodetemplate()
-    node_template.defineField(finite_element_field)
-    element_template = mesh.createElementtemplate()
-    element_template.setElementShapeType(Element.SHAPE_TYPE_SQUARE)
-    linear_basis = fieldmodule.createElementbasis(2, Elementbasis.FUNCTION_TYPE_LINEAR_LAGRANGE)
-    eft = mesh.createElementfieldtemplate(linear_basis)
-    element_template.defineField(finite_element_field, -1, eft)
-    field_cache = fieldmodule.createFieldcache()
-    with ChangeManager(fieldmodule):
-        node_identifiers = []
-        for node_coordinate in node_coordinate_set:
-            node = nodeset.createNode(-1, node_template)
-            node_identifiers.append(node.getIdentifier())
-            field_cache.setNode(node)
-            finite_element_field.assignReal(field_cache, node_coordinate)
-        element = mesh.createElement(-1, element_template)
-        element.setNodesByIdentifier(eft, node_identifiers)
-    fieldmodule.defineAllFaces()
+    _create_single_linear_element(mesh, finite_element_field, node_coordinate_set, Element.SHAPE_TYPE_SQUARE,
+                                  define_faces, template)
 
 
-def find_node_with_name(nodeset: Nodeset, name_field: Field, name):
+def get_node_name_identifiers(nodeset: Nodeset, name_field: Field):
+    """
+    Get identifiers of nodes in nodeset with each name, in a single pass.
+    Build once and pass to find_node_with_name for repeated name lookups.
+    :param nodeset: Zinc Nodeset or NodesetGroup to search.
+    :param name_field: The name field to evaluate.
+    :return: Dict of names -> list of node identifiers. Nodes with empty or
+    undefined names are omitted.
+    """
+    fieldmodule = nodeset.getFieldmodule()
+    fieldcache = fieldmodule.createFieldcache()
+    nodeiter = nodeset.createNodeiterator()
+    # Bind methods locally as they are called for every node
+    set_node = fieldcache.setNode
+    evaluate_string = name_field.evaluateString
+    next_node = nodeiter.next
+    name_identifiers = {}
+    node = next_node()
+    while node.isValid():
+        set_node(node)
+        name = evaluate_string(fieldcache)
+        if name:
+            name_identifiers.setdefault(name, []).append(node.getIdentifier())
+        node = next_node()
+    return name_identifiers
+
+
+def find_node_with_name(nodeset: Nodeset, name_field: Field, name, name_identifiers=None):
     """
     Get single node in nodeset with supplied name.
     :param nodeset: Zinc Nodeset or NodesetGroup to search.
     :param name_field: The name field to match.
-    :param name: The name to match in nameField.
+    :param name: The name to match in nameField. Empty names never match.
+    :param name_identifiers: Optional dict of names -> node identifiers from
+    get_node_name_identifiers, used instead of searching nodeset. Must be
+    rebuilt if nodes or names change.
     :return: Node with name, or None if 0 or multiple nodes with name.
     """
+    if not name:
+        return None
+    if name_identifiers is not None:
+        identifiers = name_identifiers.get(name)
+        if identifiers and (len(identifiers) == 1):
+            node = nodeset.findNodeByIdentifier(identifiers[0])
+            if node.isValid():
+                return node
+        return None
     fieldmodule = nodeset.getFieldmodule()
     fieldcache = fieldmodule.createFieldcache()
     nodeiter = nodeset.createNodeiterator()
+    # Bind methods locally as they are called for every node
+    set_node = fieldcache.setNode
+    evaluate_string = name_field.evaluateString
+    next_node = nodeiter.next
     node_with_name = None
-    node = nodeiter.next()
+    node = next_node()
     while node.isValid():
-        fieldcache.setNode(node)
-        temp_name = name_field.evaluateString(fieldcache)
+        set_node(node)
+        temp_name = evaluate_string(fieldcache)
         if temp_name == name:
             if node_with_name:
                 return None
             node_with_name = node
-        node = nodeiter.next()
+        node = next_node()
     return node_with_name
 
 
@@ -138,35 +234,48 @@ def get_node_name_centres(nodeset: Nodeset, coordinates_field: Field, name_field
     components_count = coordinates_field.getNumberOfComponents()
     fieldmodule = nodeset.getFieldmodule()
     fieldcache = fieldmodule.createFieldcache()
-    name_records = {}  # name -> (coordinates, count)
+    name_records = {}  # name -> [coordinates sum, count]
     nodeiter = nodeset.createNodeiterator()
-    node = nodeiter.next()
+    # Bind methods locally as they are called for every node
+    set_node = fieldcache.setNode
+    evaluate_string = name_field.evaluateString
+    evaluate_real = coordinates_field.evaluateReal
+    next_node = nodeiter.next
+    node = next_node()
     while node.isValid():
-        fieldcache.setNode(node)
-        name = name_field.evaluateString(fieldcache)
-        coordinates_result, coordinates = coordinates_field.evaluateReal(fieldcache, components_count)
+        set_node(node)
+        name = evaluate_string(fieldcache)
+        coordinates_result, coordinates = evaluate_real(fieldcache, components_count)
         if name and (coordinates_result == RESULT_OK):
             name_record = name_records.get(name)
             if name_record:
-                name_centre = name_record[0]
-                for c in range(components_count):
-                    name_centre[c] += coordinates[c]
+                name_record[0] = [s + c for s, c in zip(name_record[0], coordinates)]
                 name_record[1] += 1
             else:
-                name_records[name] = (coordinates, 1)
-        node = nodeiter.next()
+                name_records[name] = [coordinates, 1]
+        node = next_node()
     # divide centre coordinates by count
-    name_centres = {}
-    for name in name_records:
-        name_record = name_records[name]
-        name_count = name_record[1]
-        name_centre = name_record[0]
-        if name_count > 1:
-            scale = 1.0/name_count
-            for c in range(components_count):
-                name_centre[c] *= scale
-        name_centres[name] = name_centre
-    return name_centres
+    return {name: [s / name_count for s in name_centre] if (name_count > 1) else name_centre
+            for name, (name_centre, name_count) in name_records.items()}
+
+
+def _evaluate_field_nodeset_statistic(field: Field, nodeset: Nodeset, create_field_method, fieldcache):
+    """
+    Create and evaluate a temporary nodeset statistic field. The field is
+    created, evaluated and destroyed within a ChangeManager for the
+    fieldmodule, so no change messages are sent for it.
+    :param field: Field to compute statistic of.
+    :param nodeset: Nodeset to compute statistic over.
+    :param create_field_method: Fieldmodule method creating statistic field
+    from field and nodeset, e.g. fieldmodule.createFieldNodesetMean.
+    :param fieldcache: Fieldcache to evaluate with, shared between statistics.
+    :return: Statistic values.
+    """
+    with ChangeManager(nodeset.getFieldmodule()):
+        # statistic field is only referenced for this call so is destroyed before endChange
+        result, values = create_field_method(field, nodeset).evaluateReal(fieldcache, field.getNumberOfComponents())
+    assert result == RESULT_OK
+    return values
 
 
 def evaluate_field_nodeset_range(field: Field, nodeset: Nodeset):
@@ -174,18 +283,10 @@ def evaluate_field_nodeset_range(field: Field, nodeset: Nodeset):
     :return: min, max range of field over nodes.
     """
     fieldmodule = nodeset.getFieldmodule()
-    components_count = field.getNumberOfComponents()
-    with ChangeManager(fieldmodule):
-        min_field = fieldmodule.createFieldNodesetMinimum(field, nodeset)
-        max_field = fieldmodule.createFieldNodesetMaximum(field, nodeset)
-        fieldcache = fieldmodule.createFieldcache()
-        result, min_values = min_field.evaluateReal(fieldcache, components_count)
-        assert result == RESULT_OK
-        result, max_values = max_field.evaluateReal(fieldcache, components_count)
-        assert result == RESULT_OK
-        del min_field
-        del max_field
-        del fieldcache
+    # evaluate minimum and maximum in succession with one shared cache
+    fieldcache = fieldmodule.createFieldcache()
+    min_values = _evaluate_field_nodeset_statistic(field, nodeset, fieldmodule.createFieldNodesetMinimum, fieldcache)
+    max_values = _evaluate_field_nodeset_statistic(field, nodeset, fieldmodule.createFieldNodesetMaximum, fieldcache)
     return min_values, max_values
 
 
@@ -194,15 +295,50 @@ def evaluate_field_nodeset_mean(field: Field, nodeset: Nodeset):
     :return: Mean of field over nodeset.
     """
     fieldmodule = nodeset.getFieldmodule()
-    components_count = field.getNumberOfComponents()
-    with ChangeManager(fieldmodule):
-        mean_field = fieldmodule.createFieldNodesetMean(field, nodeset)
-        fieldcache = fieldmodule.createFieldcache()
-        result, mean_values = mean_field.evaluateReal(fieldcache, components_count)
-        assert result == RESULT_OK
-        del mean_field
-        del fieldcache
-    return mean_values
+    fieldcache = fieldmodule.createFieldcache()
+    return _evaluate_field_nodeset_statistic(field, nodeset, fieldmodule.createFieldNodesetMean, fieldcache)
+
+
+def _matrix_vector_mult2(matrix, vector):
+    """
+    Post multiply 2x2 matrix by 2-component vector.
+    """
+    r0, r1 = matrix
+    a, b = vector
+    return [r0[0] * a + r0[1] * b,
+            r1[0] * a + r1[1] * b]
+
+
+def _matrix_vector_mult3(matrix, vector):
+    """
+    Post multiply 3x3 matrix by 3-component vector.
+    """
+    r0, r1, r2 = matrix
+    a, b, c = vector
+    return [r0[0] * a + r0[1] * b + r0[2] * c,
+            r1[0] * a + r1[1] * b + r1[2] * c,
+            r2[0] * a + r2[1] * b + r2[2] * c]
+
+
+def _matrix_vector_mult_add2(matrix, vector, offset):
+    """
+    Post multiply 2x2 matrix by 2-component vector and add offset.
+    """
+    r0, r1 = matrix
+    a, b = vector
+    return [r0[0] * a + r0[1] * b + offset[0],
+            r1[0] * a + r1[1] * b + offset[1]]
+
+
+def _matrix_vector_mult_add3(matrix, vector, offset):
+    """
+    Post multiply 3x3 matrix by 3-component vector and add offset.
+    """
+    r0, r1, r2 = matrix
+    a, b, c = vector
+    return [r0[0] * a + r0[1] * b + r0[2] * c + offset[0],
+            r1[0] * a + r1[1] * b + r1[2] * c + offset[1],
+            r2[0] * a + r2[1] * b + r2[2] * c + offset[2]]
 
 
 def transform_coordinates(field: Field, rotation_scale, offset, time=0.0) -> bool:
@@ -233,6 +369,13 @@ def transform_coordinates(field: Field, rotation_scale, offset, time=0.0) -> boo
     if not fe_field.isValid():
         print('zinc.transformCoordinates: field is not finite element field type')
         return False
+    matrix = tuple(tuple(float(value) for value in row) for row in rotation_scale)
+    value_offset = tuple(float(value) for value in offset)
+    if ncomp == 3:
+        matrix_vector_mult, matrix_vector_mult_add = _matrix_vector_mult3, _matrix_vector_mult_add3
+    else:
+        matrix_vector_mult, matrix_vector_mult_add = _matrix_vector_mult2, _matrix_vector_mult_add2
+    value_label = Node.VALUE_LABEL_VALUE
     success = True
     fm = field.getFieldmodule()
     fm.beginChange()
@@ -241,27 +384,32 @@ def transform_coordinates(field: Field, rotation_scale, offset, time=0.0) -> boo
     nodes = fm.findNodesetByFieldDomainType(Field.DOMAIN_TYPE_NODES)
     node_template = nodes.createNodetemplate()
     node_iter = nodes.createNodeiterator()
-    node = node_iter.next()
+    # Bind methods locally as they are called for every node
+    define_field_from_node = node_template.defineFieldFromNode
+    get_value_number_of_versions = node_template.getValueNumberOfVersions
+    set_node = cache.setNode
+    get_node_parameters = fe_field.getNodeParameters
+    set_node_parameters = fe_field.setNodeParameters
+    next_node = node_iter.next
+    node = next_node()
     while node.isValid():
-        node_template.defineFieldFromNode(fe_field, node)
-        cache.setNode(node)
-        for derivative in [Node.VALUE_LABEL_VALUE, Node.VALUE_LABEL_D_DS1, Node.VALUE_LABEL_D_DS2,
-                           Node.VALUE_LABEL_D2_DS1DS2,
-                           Node.VALUE_LABEL_D_DS3, Node.VALUE_LABEL_D2_DS1DS3, Node.VALUE_LABEL_D2_DS2DS3,
-                           Node.VALUE_LABEL_D3_DS1DS2DS3]:
-            versions = node_template.getValueNumberOfVersions(fe_field, -1, derivative)
+        define_field_from_node(fe_field, node)
+        set_node(node)
+        for derivative in _NODE_VALUE_LABELS:
+            versions = get_value_number_of_versions(fe_field, -1, derivative)
             for v in range(versions):
-                result, values = fe_field.getNodeParameters(cache, -1, derivative, v + 1, ncomp)
+                result, values = get_node_parameters(cache, -1, derivative, v + 1, ncomp)
                 if result != RESULT_OK:
                     success = False
                 else:
-                    new_values = vectorops.matrixvectormult(rotation_scale, values)
-                    if derivative == Node.VALUE_LABEL_VALUE:
-                        new_values = vectorops.add(new_values, offset)
-                    result = fe_field.setNodeParameters(cache, -1, derivative, v + 1, new_values)
+                    if derivative == value_label:
+                        new_values = matrix_vector_mult_add(matrix, values, value_offset)
+                    else:
+                        new_values = matrix_vector_mult(matrix, values)
+                    result = set_node_parameters(cache, -1, derivative, v + 1, new_values)
                     if result != RESULT_OK:
                         success = False
-        node = node_iter.next()
+        node = next_node()
     fm.endChange()
     if not success:
         print('zinc.transformCoordinates: failed to get/set some values')
@@ -291,14 +439,18 @@ def create_nodes(finite_element_field, node_coordinate_set, node_set_name='nodes
     # Set the finite element coordinate field for the nodes to use
     node_template.defineField(finite_element_field)
     field_cache = fieldmodule.createFieldcache()
-    for node_coordinate in node_coordinate_set:
-        node = nodeset.createNode(-1, node_template)
-        # Set the node coordinates, first set the field cache to use the current node
-        field_cache.setNode(node)
-        if time:
-            field_cache.setTime(time)
-        # Pass in floats as an array
-        finite_element_field.assignReal(field_cache, node_coordinate)
+    if time:
+        field_cache.setTime(time)
+    # Bind methods locally as they are called for every node
+    create_node = nodeset.createNode
+    set_node = field_cache.setNode
+    assign_real = finite_element_field.assignReal
+    with ChangeManager(fieldmodule):
+        for node_coordinate in node_coordinate_set:
+            # Set the node coordinates, first set the field cache to use the current node
+            set_node(create_node(-1, node_template))
+            # Pass in floats as an array
+            assign_real(field_cache, node_coordinate)
 
 
 def get_element_node_identifiers(element: Element, eft: Elementfieldtemplate) -> list:
@@ -367,9 +519,11 @@ def get_maximum_node_identifier(nodeset: Nodeset) -> int:
     return maximum_node_id
 
 
+createLinearElementTemplate = create_linear_element_template
 createCubeElement = create_cube_element
 createSquareElement = create_square_element
 findNodeWithName = find_node_with_name
+getNodeNameIdentifiers = get_node_name_identifiers
 getNodeNameCentres = get_node_name_centres
 evaluateFieldNodesetRange = evaluate_field_nodeset_range
 evaluateFieldNodesetMean = evaluate_field_nodeset_mean
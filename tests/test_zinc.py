@@ -1,11 +1,14 @@
 import os
 import unittest
 from opencmiss.utils.zinc.field import createFieldMeshIntegral, findOrCreateFieldCoordinates, \
-    findOrCreateFieldGroup, findOrCreateFieldNodeGroup
-from opencmiss.utils.zinc.finiteelement import createCubeElement, createSquareElement, createNodes, \
-    createTriangleElements, evaluateFieldNodesetMean
+    findOrCreateFieldGroup, findOrCreateFieldNodeGroup, findOrCreateFieldStoredString
+from opencmiss.utils.zinc.finiteelement import createCubeElement, createLinearElementTemplate, \
+    createSquareElement, createNodes, createTriangleElements, evaluateFieldNodesetMean, evaluateFieldNodesetRange, \
+    findNodeWithName, getNodeNameCentres, getNodeNameIdentifiers, transformCoordinates
 from opencmiss.zinc.context import Context
+from opencmiss.zinc.element import Element
 from opencmiss.zinc.field import Field
+from opencmiss.zinc.node import Node
 from opencmiss.zinc.result import RESULT_OK
 
 here = os.path.abspath(os.path.dirname(__file__))
@@ -118,6 +121,181 @@ class ZincUtilsTestCase(unittest.TestCase):
         self.assertEqual(RESULT_OK, result)
         self.assertAlmostEqual(0.9, volume, delta=1.0E-7)
 
+    def test_transform_coordinates(self):
+        """
+        Test transformation of node coordinates by matrix and offset.
+        """
+        context = Context("test")
+        region = context.createRegion()
+        fieldmodule = region.getFieldmodule()
+        coordinates = findOrCreateFieldCoordinates(fieldmodule)
+        nodes = fieldmodule.findNodesetByFieldDomainType(Field.DOMAIN_TYPE_NODES)
+        node_coordinates4 = [[0.1, 0.2, 0.3], [1.1, 0.2, 0.4], [0.1, 1.2, 0.4], [1.1, 1.2, 0.3]]
+        createNodes(coordinates, node_coordinates4, node_set=nodes)
+        rotation_scale = [[0.0, -2.0, 0.0], [2.0, 0.0, 0.0], [0.0, 0.0, 1.0]]
+        offset = [1.0, 2.0, 3.0]
+        self.assertTrue(transformCoordinates(coordinates, rotation_scale, offset))
+        mean_coordinates = evaluateFieldNodesetMean(coordinates, nodes)
+        assert_almost_equal_list(self, [-0.4, 3.2, 3.35], mean_coordinates, delta=1.0E-7)
+        min_coordinates, max_coordinates = evaluateFieldNodesetRange(coordinates, nodes)
+        assert_almost_equal_list(self, [-1.4, 2.2, 3.3], min_coordinates, delta=1.0E-7)
+        assert_almost_equal_list(self, [0.6, 4.2, 3.4], max_coordinates, delta=1.0E-7)
+        self.assertFalse(transformCoordinates(coordinates, [[1.0, 0.0], [0.0, 1.0]], [0.0, 0.0]))
+
+    def test_transform_coordinates_2d(self):
+        """
+        Test transformation of 2-component node coordinates by matrix and offset.
+        """
+        context = Context("test")
+        region = context.createRegion()
+        fieldmodule = region.getFieldmodule()
+        coordinates = findOrCreateFieldCoordinates(fieldmodule, components_count=2)
+        nodes = fieldmodule.findNodesetByFieldDomainType(Field.DOMAIN_TYPE_NODES)
+        createNodes(coordinates, [[1.0, 0.0], [0.0, 1.0], [2.0, 3.0]], node_set=nodes)
+        rotation_scale = [[0.0, -2.0], [2.0, 0.0]]
+        offset = [1.0, 2.0]
+        self.assertTrue(transformCoordinates(coordinates, rotation_scale, offset))
+        fieldcache = fieldmodule.createFieldcache()
+        expected_node_coordinates = [[1.0, 4.0], [-1.0, 2.0], [-5.0, 6.0]]
+        for node_identifier, expected_coordinates in enumerate(expected_node_coordinates, start=1):
+            fieldcache.setNode(nodes.findNodeByIdentifier(node_identifier))
+            result, node_coordinates = coordinates.evaluateReal(fieldcache, 2)
+            self.assertEqual(RESULT_OK, result)
+            assert_almost_equal_list(self, expected_coordinates, node_coordinates, delta=1.0E-7)
+
+    def test_transform_coordinates_derivatives(self):
+        """
+        Test transformation of node derivatives and versions, which are not offset.
+        """
+        context = Context("test")
+        region = context.createRegion()
+        fieldmodule = region.getFieldmodule()
+        coordinates = findOrCreateFieldCoordinates(fieldmodule).castFiniteElement()
+        nodes = fieldmodule.findNodesetByFieldDomainType(Field.DOMAIN_TYPE_NODES)
+        node_template = nodes.createNodetemplate()
+        node_template.defineField(coordinates)
+        self.assertEqual(RESULT_OK, node_template.setValueNumberOfVersions(coordinates, -1, Node.VALUE_LABEL_D_DS1, 2))
+        fieldcache = fieldmodule.createFieldcache()
+        node = nodes.createNode(-1, node_template)
+        fieldcache.setNode(node)
+        coordinates.setNodeParameters(fieldcache, -1, Node.VALUE_LABEL_VALUE, 1, [0.1, 0.2, 0.3])
+        coordinates.setNodeParameters(fieldcache, -1, Node.VALUE_LABEL_D_DS1, 1, [1.0, 0.0, 0.0])
+        coordinates.setNodeParameters(fieldcache, -1, Node.VALUE_LABEL_D_DS1, 2, [0.0, 0.5, 0.25])
+        rotation_scale = [[0.0, -2.0, 0.0], [2.0, 0.0, 0.0], [0.0, 0.0, 1.0]]
+        offset = [1.0, 2.0, 3.0]
+        self.assertTrue(transformCoordinates(coordinates, rotation_scale, offset))
+        fieldcache.setNode(node)
+        for value_label, version, expected_values in (
+                (Node.VALUE_LABEL_VALUE, 1, [0.6, 2.2, 3.3]),
+                (Node.VALUE_LABEL_D_DS1, 1, [0.0, 2.0, 0.0]),
+                (Node.VALUE_LABEL_D_DS1, 2, [-1.0, 0.0, 0.25])):
+            result, values = coordinates.getNodeParameters(fieldcache, -1, value_label, version, 3)
+            self.assertEqual(RESULT_OK, result)
+            assert_almost_equal_list(self, expected_values, values, delta=1.0E-7)
+
+    def test_node_names(self):
+        """
+        Test finding nodes by name and mean coordinates of nodes sharing names.
+        """
+        context = Context("test")
+        region = context.createRegion()
+        fieldmodule = region.getFieldmodule()
+        coordinates = findOrCreateFieldCoordinates(fieldmodule)
+        name_field = findOrCreateFieldStoredString(fieldmodule, "name")
+        nodes = fieldmodule.findNodesetByFieldDomainType(Field.DOMAIN_TYPE_NODES)
+        node_template = nodes.createNodetemplate()
+        node_template.defineField(coordinates)
+        node_template.defineField(name_field)
+        fieldcache = fieldmodule.createFieldcache()
+        node_names_coordinates = [("a", [0.1, 0.2, 0.3]), ("b", [1.1, 0.2, 0.4]),
+                                  ("a", [0.1, 1.2, 0.4]), ("a", [1.1, 1.2, 0.2]), ("", [2.0, 2.0, 2.0])]
+        for name, node_coordinates in node_names_coordinates:
+            node = nodes.createNode(-1, node_template)
+            fieldcache.setNode(node)
+            coordinates.assignReal(fieldcache, node_coordinates)
+            name_field.assignString(fieldcache, name)
+        name_centres = getNodeNameCentres(nodes, coordinates, name_field)
+        self.assertEqual(["a", "b"], sorted(name_centres.keys()))
+        assert_almost_equal_list(self, [1.3 / 3.0, 2.6 / 3.0, 0.3], name_centres["a"], delta=1.0E-7)
+        assert_almost_equal_list(self, [1.1, 0.2, 0.4], name_centres["b"], delta=1.0E-7)
+
+        self.assertIsNone(findNodeWithName(nodes, name_field, "a"))
+        self.assertEqual(2, findNodeWithName(nodes, name_field, "b").getIdentifier())
+        self.assertIsNone(findNodeWithName(nodes, name_field, "c"))
+        name_identifiers = getNodeNameIdentifiers(nodes, name_field)
+        self.assertEqual({"a": [1, 3, 4], "b": [2]}, name_identifiers)
+        self.assertIsNone(findNodeWithName(nodes, name_field, "a", name_identifiers))
+        self.assertEqual(2, findNodeWithName(nodes, name_field, "b", name_identifiers).getIdentifier())
+        self.assertIsNone(findNodeWithName(nodes, name_field, "c", name_identifiers))
+        self.assertIsNone(findNodeWithName(nodes, name_field, ""))
+        self.assertIsNone(findNodeWithName(nodes, name_field, "", name_identifiers))
+
+    def test_create_elements_deferred_faces(self):
+        """
+        Test creating several elements from one template then defining faces once.
+        """
+        context = Context("test")
+        region = context.createRegion()
+        fieldmodule = region.getFieldmodule()
+        coordinates = findOrCreateFieldCoordinates(fieldmodule)
+        mesh1d = fieldmodule.findMeshByDimension(1)
+        mesh2d = fieldmodule.findMeshByDimension(2)
+        template = createLinearElementTemplate(mesh2d, coordinates, Element.SHAPE_TYPE_SQUARE)
+        createSquareElement(mesh2d, coordinates, [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [1.0, 1.0, 0.0]],
+                            define_faces=False, template=template)
+        createSquareElement(mesh2d, coordinates, [[0.0, 0.0, 1.0], [1.0, 0.0, 1.0], [0.0, 1.0, 1.0], [1.0, 1.0, 1.0]],
+                            define_faces=False, template=template)
+        self.assertEqual(2, mesh2d.getSize())
+        self.assertEqual(0, mesh1d.getSize())
+        fieldmodule.defineAllFaces()
+        self.assertEqual(8, mesh1d.getSize())
+
+    def test_create_elements_from_template(self):
+        """
+        Test creating triangle and cube elements from reused templates, and rejecting mismatched templates.
+        """
+        context = Context("test")
+        region = context.createRegion()
+        fieldmodule = region.getFieldmodule()
+        coordinates = findOrCreateFieldCoordinates(fieldmodule)
+        nodes = fieldmodule.findNodesetByFieldDomainType(Field.DOMAIN_TYPE_NODES)
+        mesh1d = fieldmodule.findMeshByDimension(1)
+        mesh2d = fieldmodule.findMeshByDimension(2)
+        node_coordinates4 = [[0.1, 0.2, 0.3], [1.1, 0.2, 0.4], [0.1, 1.2, 0.4], [1.1, 1.2, 0.3]]
+        createNodes(coordinates, node_coordinates4, node_set=nodes)
+        template = createLinearElementTemplate(mesh2d, coordinates, Element.SHAPE_TYPE_TRIANGLE)
+        self.assertEqual(Element.SHAPE_TYPE_TRIANGLE, template[0].getElementShapeType())
+        self.assertEqual(3, template[1].getNumberOfLocalNodes())
+        createTriangleElements(mesh2d, coordinates, [[1, 2, 3]], template=template)
+        createTriangleElements(mesh2d, coordinates, [[3, 2, 4]], template=template)
+        self.assertEqual(2, mesh2d.getSize())
+        self.assertEqual(5, mesh1d.getSize())
+        square_template = createLinearElementTemplate(mesh2d, coordinates, Element.SHAPE_TYPE_SQUARE)
+        mesh3d = fieldmodule.findMeshByDimension(3)
+        with self.assertRaises(AssertionError):
+            createLinearElementTemplate(mesh3d, coordinates, Element.SHAPE_TYPE_TRIANGLE)
+        with self.assertRaises(AssertionError):
+            createLinearElementTemplate(mesh3d, coordinates, Element.SHAPE_TYPE_WEDGE12)
+        with self.assertRaises(AssertionError):
+            createTriangleElements(mesh2d, coordinates, [[1, 2, 4]], template=square_template)
+        self.assertEqual(2, mesh2d.getSize())
+
+        region = context.createRegion()
+        fieldmodule = region.getFieldmodule()
+        coordinates = findOrCreateFieldCoordinates(fieldmodule)
+        mesh3d = fieldmodule.findMeshByDimension(3)
+        template = createLinearElementTemplate(mesh3d, coordinates, Element.SHAPE_TYPE_CUBE)
+        node_coordinates8 = [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [1.0, 1.0, 0.0],
+                             [0.0, 0.0, 1.0], [1.0, 0.0, 1.0], [0.0, 1.0, 1.0], [1.0, 1.0, 1.0]]
+        createCubeElement(mesh3d, coordinates, node_coordinates8, template=template)
+        createCubeElement(mesh3d, coordinates, [[x + 1.0, y, z] for x, y, z in node_coordinates8], template=template)
+        self.assertEqual(2, mesh3d.getSize())
+        volume_field = createFieldMeshIntegral(coordinates, mesh3d, number_of_points=1)
+        fieldcache = fieldmodule.createFieldcache()
+        result, volume = volume_field.evaluateReal(fieldcache, 1)
+        self.assertEqual(RESULT_OK, result)
+        self.assertAlmostEqual(2.0, volume, delta=1.0E-7)
+
 
 if __name__ == "__main__":
     unittest.main()